@@ -6,18 +6,21 @@ Demonstrates basic API access and response handling.
 """
 
 import asyncio
+import contextlib
 import aiohttp
-from typing import Dict, Any
+import orjson
+from typing import Dict, Any, Optional
 from src.shared.utils.logger import logger
-from src.shared.config import config as shared_config
+from src.shared.config import get_server_url
 
 
-async def free_command(args: list) -> None:
+async def free_command(args: list, session: Optional[aiohttp.ClientSession] = None) -> None:
     """
     Free command implementation
     
     Args:
         args: Command arguments (unused)
+        session: Optional shared HTTP session; a temporary one is used if omitted
     """
     try:
         # Log free endpoint access attempt
@@ -27,20 +30,21 @@ async def free_command(args: list) -> None:
         })
 
         # Get server configuration
-        server_config = shared_config.get_server_config("python")
-        base_url = f"http://{server_config['host']}:{server_config['port']}"
+        base_url = get_server_url()
         
         # Create HTTP client and access free endpoint
         logger.ui('\n🔓 Accessing free endpoint...')
         
-        async with aiohttp.ClientSession() as session:
+        async with contextlib.AsyncExitStack() as stack:
+            if session is None:
+                session = await stack.enter_async_context(aiohttp.ClientSession())
             async with session.get(f"{base_url}/free", timeout=aiohttp.ClientTimeout(total=10)) as response:
                 if response.status != 200:
                     logger.error(f'Server error: {response.status}')
                     logger.ui(f'💡 Make sure the server is running: npm run py:server')
                     return
                 
-                response_data = await response.json()
+                response_data = await response.json(loads=orjson.loads)
                 
                 # Validate response format
                 if not response_data or not isinstance(response_data, dict):
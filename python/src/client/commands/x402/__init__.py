@@ -4,13 +4,25 @@ X402 Commands Module
 Shared utilities and configurations for X402 payment commands.
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import sys
+import time
+from enum import IntEnum
+from typing import Dict, Any, Iterator, Optional, Set, Tuple
 from dataclasses import dataclass
+import aiohttp
 from src.shared.utils.logger import logger
 from src.shared.utils.wallet_manager import WalletManager
-from src.client.core.custom_x402_client import CustomX402Client
+from src.client.core.custom_x402_client import CustomX402Client, CDPSigner, LocalSigner, PaymentSigner
 from cdp import CdpClient
-from src.shared.config import get_cdp_config
+from src.shared.config import get_cdp_config, get_local_signer_key, get_server_url
+
+
+class Tier(IntEnum):
+    """X402 payment tiers, usable as indices into the endpoint table"""
+    TIER1 = 0
+    TIER2 = 1
+    TIER3 = 2
 
 
 @dataclass
@@ -21,32 +33,45 @@ class X402EndpointConfig:
     tier: str
     tier_name: str
     description: str
+    amount: str  # Payment amount in wei
 
 
-# X402 endpoint configurations for all tiers
-X402_ENDPOINTS: Dict[str, X402EndpointConfig] = {
-    "tier1": X402EndpointConfig(
+# X402 endpoint configurations for all tiers, indexed by Tier
+_ENDPOINTS: Tuple[X402EndpointConfig, ...] = (
+    X402EndpointConfig(
         endpoint="/protected",
         expected_cost="~0.01 USDC",
         tier="tier1",
         tier_name="Basic Premium",
-        description="Basic premium features with AI analysis and market data"
+        description="Basic premium features with AI analysis and market data",
+        amount="10000"  # 0.01 USDC in wei
     ),
-    "tier2": X402EndpointConfig(
+    X402EndpointConfig(
         endpoint="/premium",
         expected_cost="~0.1 USDC",
         tier="tier2",
         tier_name="Premium Plus",
-        description="Advanced AI models, predictive analytics, and exclusive reports"
+        description="Advanced AI models, predictive analytics, and exclusive reports",
+        amount="100000"  # 0.1 USDC in wei
     ),
-    "tier3": X402EndpointConfig(
+    X402EndpointConfig(
         endpoint="/enterprise",
         expected_cost="~1.0 USDC",
         tier="tier3",
         tier_name="Enterprise",
-        description="Enterprise analytics, institutional data, and custom insights"
+        description="Enterprise analytics, institutional data, and custom insights",
+        amount="1000000"  # 1.0 USDC in wei
     )
-}
+)
+
+# String-keyed view kept for backward compatibility
+X402_ENDPOINTS: Dict[str, X402EndpointConfig] = {config.tier: config for config in _ENDPOINTS}
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_background_tasks: Set[asyncio.Task] = set()
+
+# Feature groups that may carry market data, in display priority order
+_MARKET_DATA_GROUPS = ('premiumFeatures', 'premiumPlusFeatures')
 
 
 async def validate_balance_for_x402(wallet_manager: WalletManager) -> Optional[float]:
@@ -131,18 +156,30 @@ def display_premium_content(response_data: Dict[str, Any], config: X402EndpointC
     if not response_data:
         return
     
-    logger.ui(f"\n{config.tier_name.upper()} CONTENT ACCESSED")
-    logger.ui("═══════════════════════════════════════════════════════════")
+    # Emit the whole report in one write instead of one log record per line
+    logger.ui("\n".join(_iter_premium_lines(response_data, config)))
+
+
+def _iter_premium_lines(response_data: Dict[str, Any], config: X402EndpointConfig) -> Iterator[str]:
+    """
+    Yield the formatted lines of a premium content response
+    
+    Args:
+        response_data: Response data from the server
+        config: Endpoint configuration
+    """
+    yield f"\n{config.tier_name.upper()} CONTENT ACCESSED"
+    yield "═══════════════════════════════════════════════════════════"
     
     # Payment verification status
     if response_data.get('paymentVerified'):
-        logger.ui(f"✅ PAYMENT VERIFIED - Access Granted to {config.tier_name}")
+        yield f"✅ PAYMENT VERIFIED - Access Granted to {config.tier_name}"
     
     if response_data.get('message'):
-        logger.ui(f"📢 {response_data['message']}")
+        yield f"📢 {response_data['message']}"
     
     if response_data.get('subtitle'):
-        logger.ui(f"   {response_data['subtitle']}")
+        yield f"   {response_data['subtitle']}"
     
     # Display rich content from data field
     if response_data.get('data'):
@@ -151,102 +188,101 @@ def display_premium_content(response_data: Dict[str, Any], config: X402EndpointC
         # Payment details
         if data.get('payment'):
             payment = data['payment']
-            logger.ui(f"\n💳 Payment Details:")
-            logger.ui(f"   Amount: {payment.get('amount', 'N/A')}")
-            logger.ui(f"   Paid By: {payment.get('paidBy', 'N/A')}")
-            logger.ui(f"   Transaction: {payment.get('transactionType', 'N/A')}")
+            yield f"\n💳 Payment Details:"
+            yield f"   Amount: {payment.get('amount', 'N/A')}"
+            yield f"   Paid By: {payment.get('paidBy', 'N/A')}"
+            yield f"   Transaction: {payment.get('transactionType', 'N/A')}"
         
         # AI Analysis (for protected/premium tiers)
         if data.get('premiumFeatures', {}).get('aiAnalysis'):
             ai = data['premiumFeatures']['aiAnalysis']
-            logger.ui(f"\n🤖 AI Analysis:")
-            logger.ui(f"   Sentiment: {ai.get('sentiment', 'N/A')}")
-            logger.ui(f"   Confidence: {ai.get('confidence', 'N/A')}")
-            logger.ui(f"   Summary: {ai.get('summary', 'N/A')}")
+            yield f"\n🤖 AI Analysis:"
+            yield f"   Sentiment: {ai.get('sentiment', 'N/A')}"
+            yield f"   Confidence: {ai.get('confidence', 'N/A')}"
+            yield f"   Summary: {ai.get('summary', 'N/A')}"
             if ai.get('keywords'):
-                logger.ui(f"   Keywords: {', '.join(ai['keywords'])}")
+                yield f"   Keywords: {', '.join(ai['keywords'])}"
         
         # AI Models (for premium tier)
         if data.get('premiumPlusFeatures', {}).get('aiModels'):
             ai = data['premiumPlusFeatures']['aiModels']
-            logger.ui(f"\n🤖 Advanced AI Models:")
-            logger.ui(f"   Sentiment: {ai.get('sentiment', 'N/A')}")
-            logger.ui(f"   Confidence: {ai.get('confidence', 'N/A')}")
-            logger.ui(f"   Model: {ai.get('modelVersion', 'N/A')}")
-            logger.ui(f"   Summary: {ai.get('summary', 'N/A')}")
+            yield f"\n🤖 Advanced AI Models:"
+            yield f"   Sentiment: {ai.get('sentiment', 'N/A')}"
+            yield f"   Confidence: {ai.get('confidence', 'N/A')}"
+            yield f"   Model: {ai.get('modelVersion', 'N/A')}"
+            yield f"   Summary: {ai.get('summary', 'N/A')}"
             if ai.get('keywords'):
-                logger.ui(f"   Keywords: {', '.join(ai['keywords'])}")
+                yield f"   Keywords: {', '.join(ai['keywords'])}"
         
         # Advanced AI (for enterprise tier)
         if data.get('enterpriseFeatures', {}).get('advancedAI'):
             ai = data['enterpriseFeatures']['advancedAI']
-            logger.ui(f"\n🏛️ Institutional AI:")
-            logger.ui(f"   Sentiment: {ai.get('sentiment', 'N/A')}")
-            logger.ui(f"   Confidence: {ai.get('confidence', 'N/A')}")
-            logger.ui(f"   Model: {ai.get('modelVersion', 'N/A')}")
-            logger.ui(f"   Summary: {ai.get('summary', 'N/A')}")
+            yield f"\n🏛️ Institutional AI:"
+            yield f"   Sentiment: {ai.get('sentiment', 'N/A')}"
+            yield f"   Confidence: {ai.get('confidence', 'N/A')}"
+            yield f"   Model: {ai.get('modelVersion', 'N/A')}"
+            yield f"   Summary: {ai.get('summary', 'N/A')}"
             if ai.get('riskAssessment'):
                 risk = ai['riskAssessment']
-                logger.ui(f"   Risk Score: {risk.get('score', 'N/A')}")
+                yield f"   Risk Score: {risk.get('score', 'N/A')}"
         
-        # Market Data
-        market_data = None
-        if data.get('premiumFeatures', {}).get('marketData'):
-            market_data = data['premiumFeatures']['marketData']
-        elif data.get('premiumPlusFeatures', {}).get('marketData'):
-            market_data = data['premiumPlusFeatures']['marketData']
+        # Market Data (first feature group that carries it wins)
+        market_data = next(
+            (data[k]['marketData'] for k in _MARKET_DATA_GROUPS if data.get(k, {}).get('marketData')),
+            None
+        )
         
         if market_data:
-            logger.ui(f"\n📊 Market Data:")
+            yield f"\n📊 Market Data:"
             if market_data.get('predictiveModel'):
                 model = market_data['predictiveModel']
-                logger.ui(f"   Next Hour: {model.get('nextHour', 'N/A')}")
+                yield f"   Next Hour: {model.get('nextHour', 'N/A')}"
                 if model.get('nextDay'):
-                    logger.ui(f"   Next Day: {model.get('nextDay', 'N/A')}")
-                logger.ui(f"   Accuracy: {model.get('accuracy', 'N/A')}")
+                    yield f"   Next Day: {model.get('nextDay', 'N/A')}"
+                yield f"   Accuracy: {model.get('accuracy', 'N/A')}"
                 if model.get('signals'):
-                    logger.ui(f"   Signals: {', '.join(model['signals'])}")
+                    yield f"   Signals: {', '.join(model['signals'])}"
         
         # Institutional Data (for enterprise tier)
         if data.get('enterpriseFeatures', {}).get('institutionalData'):
             inst = data['enterpriseFeatures']['institutionalData']
-            logger.ui(f"\n🏦 Institutional Data:")
+            yield f"\n🏦 Institutional Data:"
             if inst.get('whaleMovements'):
-                logger.ui(f"   Whale Movements: {len(inst['whaleMovements'])} tracked")
+                yield f"   Whale Movements: {len(inst['whaleMovements'])} tracked"
             if inst.get('darkPoolActivity'):
                 dark = inst['darkPoolActivity']
-                logger.ui(f"   Dark Pool Volume: {dark.get('volume24h', 'N/A')}")
+                yield f"   Dark Pool Volume: {dark.get('volume24h', 'N/A')}"
             if inst.get('yieldOpportunities'):
-                logger.ui(f"   Yield Opportunities: {len(inst['yieldOpportunities'])} available")
+                yield f"   Yield Opportunities: {len(inst['yieldOpportunities'])} available"
         
         # Access information
         if data.get('access'):
             access = data['access']
-            logger.ui(f"\n🎫 Access Information:")
-            logger.ui(f"   Level: {access.get('accessLevel', 'N/A')}")
-            logger.ui(f"   Valid Until: {access.get('validUntil', 'N/A')}")
-            logger.ui(f"   API Calls Remaining: {access.get('apiCallsRemaining', 'N/A')}")
+            yield f"\n🎫 Access Information:"
+            yield f"   Level: {access.get('accessLevel', 'N/A')}"
+            yield f"   Valid Until: {access.get('validUntil', 'N/A')}"
+            yield f"   API Calls Remaining: {access.get('apiCallsRemaining', 'N/A')}"
         
         # Insights
         if data.get('insights'):
-            logger.ui(f"\n💡 Key Insights:")
+            yield f"\n💡 Key Insights:"
             for insight in data['insights']:
-                logger.ui(f"   {insight}")
+                yield f"   {insight}"
         
         # Developer information
         if data.get('developer'):
             dev = data['developer']
-            logger.ui(f"\n🔧 Developer Info:")
-            logger.ui(f"   Implementation: {dev.get('implementation', 'N/A')}")
-            logger.ui(f"   Cost: {dev.get('cost', 'N/A')}")
-            logger.ui(f"   Billing: {dev.get('billing', 'N/A')}")
+            yield f"\n🔧 Developer Info:"
+            yield f"   Implementation: {dev.get('implementation', 'N/A')}"
+            yield f"   Cost: {dev.get('cost', 'N/A')}"
+            yield f"   Billing: {dev.get('billing', 'N/A')}"
     
     # Display tier information (fallback for old format)
     if response_data.get('tier'):
-        logger.ui(f"\n🎫 Access Level: {response_data['tier']}")
+        yield f"\n🎫 Access Level: {response_data['tier']}"
     
     if response_data.get('description'):
-        logger.ui(f"📋 {response_data['description']}")
+        yield f"📋 {response_data['description']}"
 
 
 def handle_x402_error(error: Exception, config: X402EndpointConfig):
@@ -267,7 +303,8 @@ async def handle_payment_completion(
     response_data: Dict[str, Any], 
     account, 
     duration: str, 
-    wallet_manager: WalletManager
+    wallet_manager: WalletManager,
+    background: bool = False
 ):
     """
     Handle payment completion and balance refresh
@@ -277,6 +314,9 @@ async def handle_payment_completion(
         account: CDP account used for payment
         duration: Duration of the request
         wallet_manager: Wallet manager instance
+        background: Refresh the balance in a background task instead of
+            awaiting it. Only safe when the event loop outlives the command,
+            as in the interactive CLI.
     """
     try:
         # Log transaction details
@@ -288,9 +328,144 @@ async def handle_payment_completion(
             'status': 'success'
         })
         
-        # Refresh balance
-        new_balance = await wallet_manager.get_usdc_balance()
-        logger.ui(f"💰 Updated Balance: {new_balance} USDC")
+        if background:
+            # Refresh balance in the background so the command returns immediately
+            task = asyncio.create_task(wallet_manager.get_usdc_balance())
+            _background_tasks.add(task)
+            task.add_done_callback(_report_refreshed_balance)
+        else:
+            # Refresh balance
+            new_balance = await wallet_manager.get_usdc_balance()
+            logger.ui(f"💰 Updated Balance: {new_balance} USDC")
         
     except Exception as e:
-        logger.error('Failed to handle payment completion', e) 
\ No newline at end of file
+        logger.error('Failed to handle payment completion', e)
+
+
+async def cancel_background_tasks():
+    """Cancel pending background balance refreshes and wait for them to unwind"""
+    tasks = list(_background_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _report_refreshed_balance(task: asyncio.Task):
+    """
+    Print the refreshed balance once the background lookup finishes
+    
+    Uses print rather than the logger: the logger's handler holds the
+    original stderr, while print resolves sys.stdout/sys.stderr at call
+    time and so goes through prompt_toolkit's patch_stdout, landing above
+    the active prompt instead of on top of it.
+    """
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    if task.exception():
+        print(f"❌ Balance refresh failed: {task.exception()}", file=sys.stderr)
+    else:
+        print(f"💰 Updated Balance: {task.result()} USDC")
+
+
+def _build_signer(account: Any) -> PaymentSigner:
+    """
+    Pick the payment signer for a CDP account
+    
+    Uses a LocalSigner when X402_LOCAL_PRIVATE_KEY holds this wallet's key,
+    falling back to signing through CDP otherwise.
+    
+    Args:
+        account: CDP account that will pay
+        
+    Returns:
+        Signer for the X402 client
+    """
+    private_key = get_local_signer_key()
+    if private_key:
+        try:
+            signer = LocalSigner(private_key)
+        except Exception as e:
+            logger.warning(f"Local signing unavailable, using CDP signer: {e}")
+        else:
+            if signer.address.lower() == str(getattr(account, 'address', '')).lower():
+                logger.ui("   • Signing: local key")
+                return signer
+            logger.warning("X402_LOCAL_PRIVATE_KEY does not match the wallet address, using CDP signer")
+    return CDPSigner(account)
+
+
+async def run_tier(
+    wallet_manager: WalletManager,
+    tier: Tier,
+    session: Optional[aiohttp.ClientSession] = None,
+    background: bool = False
+):
+    """
+    Execute an X402 payment command for the given tier
+    
+    Args:
+        wallet_manager: Wallet manager instance
+        tier: Tier to pay for
+        session: Optional shared HTTP session (defaults to a per-call one)
+        background: Refresh the balance after payment in the background
+    """
+    start_time = time.time()
+    config = _ENDPOINTS[tier]
+    
+    try:
+        # Validate balance first
+        balance = await validate_balance_for_x402(wallet_manager)
+        if balance is None:
+            return
+        
+        # Get wallet address
+        wallet_address = wallet_manager.get_address()
+        logger.ui(f"📱 Using wallet: {wallet_address}")
+        
+        # Get server URL from config
+        server_url = get_server_url()
+        
+        # Initialize CDP client and account (same as test file)
+        cdp_config = get_cdp_config()
+        async with CdpClient(
+            api_key_id=cdp_config.api_key_id,
+            api_key_secret=cdp_config.api_key_secret,
+            wallet_secret=cdp_config.wallet_secret
+        ) as cdp:
+            account = await cdp.evm.get_account(wallet_address)
+            
+            logger.ui("✅ CDP signer initialized")
+            logger.ui(f"🔍 CDP Signer Status:")
+            logger.ui(f"   • Address: {getattr(account, 'address', None)}")
+            logger.ui(f"   • Account Type: CDP Account")
+            logger.ui(f"   • Interface: sign_typed_data (EIP-712)")
+            
+            # Create signer wrapper and X402 client
+            signer = _build_signer(account)
+            x402_client = CustomX402Client(signer, session)
+            
+            # Make request to the tier endpoint
+            logger.ui(f"💸 Making X402 payment to {config.tier_name}...")
+            try:
+                result = await x402_client.make_payment_request(
+                    url=f"{server_url}{config.endpoint}",
+                    amount=config.amount
+                )
+            finally:
+                await x402_client.aclose()
+            
+            if result["success"]:
+                # Display premium content
+                display_premium_content(result["data"], config)
+                
+                # Handle payment completion
+                duration = f"{time.time() - start_time:.2f}"
+                await handle_payment_completion(result["data"], account, duration, wallet_manager, background)
+            else:
+                logger.ui(f"❌ Payment failed: {result.get('error', 'Unknown error')}")
+                if 'details' in result:
+                    logger.ui(f"📋 Details: {result['details']}")
+            
+    except Exception as error:
+        handle_x402_error(error, config)
@@ -5,7 +5,6 @@ This module provides a function to get an EvmLocalAccount from the CDP SDK,
 which is compatible with eth_account and X402 client libraries.
 """
 
-import asyncio
 from cdp import CdpClient
 from cdp.evm_local_account import EvmLocalAccount
 from src.shared.config import get_cdp_config
@@ -27,9 +26,3 @@ async def get_cdp_local_account(account_name: str) -> EvmLocalAccount:
     )
     account = await cdp_client.evm.get_or_create_account(name=account_name)
     return EvmLocalAccount(account)
-
-def get_cdp_local_account_sync(account_name: str) -> EvmLocalAccount:
-    """
-    Synchronous version for CLI usage
-    """
-    return asyncio.run(get_cdp_local_account(account_name)) 
\ No newline at end of file
@@ -4,23 +4,122 @@ Core CLI functionality for X402 CDP Integration
 
 import cmd
 import asyncio
+import importlib
 import json
+import threading
 from pathlib import Path
-from typing import Dict, Any
+import aiohttp
+from typing import Dict, Any, Optional
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
+from rich.text import Text
 from src.shared.utils.logger import logger
 from src.shared.utils.wallet_manager import WalletManager
 from src.shared.config import get_server_url
 from .commands import CommandRegistry
-from .cdp_signer import get_cdp_local_account_sync
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../..', 'src'))
+from .cdp_signer import get_cdp_local_account
+
+try:
+    import uvloop  # libuv-backed event loop, optional
+except ImportError:
+    uvloop = None
+
+try:
+    from prompt_toolkit import PromptSession  # line editor with history, optional
+    from prompt_toolkit.completion import WordCompleter
+    from prompt_toolkit.history import FileHistory
+    from prompt_toolkit.patch_stdout import patch_stdout
+except ImportError:
+    PromptSession = None
 
 console = Console()
 
+HELP_TEXT = """
+📖 **Available Commands**
+
+**Wallet Management:**
+  balance, bal     - Check USDC balance
+  fund [amount]    - Fund wallet with USDC (default: 5.0)
+  info, status     - Show wallet information
+  refresh, reload  - Force refresh from blockchain
+
+**X402 Premium Content:**
+  tier1, basic     - X402 Basic Premium (~0.01 USDC)
+                    Basic premium features with AI analysis and market data
+  tier2, premium   - X402 Premium Plus (~0.1 USDC)
+                    Advanced AI models, predictive analytics, and exclusive reports
+  tier3, enterprise- X402 Enterprise (~1.0 USDC)
+                    Enterprise analytics, institutional data, and custom insights
+  free             - Access free content (no payment required)
+
+**Utility:**
+  clear, cls       - Clear the screen
+  help, h          - Show this help message
+  exit, quit, q    - Exit the CLI
+
+**Examples:**
+  balance          - Check current USDC balance
+  fund             - Fund with 5.0 USDC
+  fund 10          - Fund with 10.0 USDC
+  tier1            - Access Basic Premium content
+  tier2            - Access Premium Plus content
+  tier3            - Access Enterprise content
+  free             - Access free content
+  info             - Show wallet details
+  refresh          - Refresh data from blockchain
+
+**X402 Payment Flow:**
+  • Commands automatically check your balance
+  • Payments are processed via X402 protocol
+  • Dynamic pricing is discovered during requests
+  • Balance is refreshed after successful payments
+"""
+
+# Rows of the wallet info table that never change
+_STATIC_INFO_ROWS = (
+    ("Network", "Base Sepolia"),
+    ("Status", "Active"),
+    ("Type", "CDP Accounts V2"),
+)
+
+
+# Tier command functions, imported on first use and then cached
+TIER_CMDS: Dict[int, Any] = {}
+
+
+def _tier(n: int):
+    """Return tierN_command, importing its module only once"""
+    if n not in TIER_CMDS:
+        module = importlib.import_module(f'src.client.commands.x402.tier{n}')
+        TIER_CMDS[n] = getattr(module, f'tier{n}_command')
+    return TIER_CMDS[n]
+
+
+# Seconds run_sync waits for an interrupted coroutine to unwind
+_CANCEL_GRACE = 5
+
+
+async def _signal_when_done(coro, done: threading.Event):
+    """Await coro, setting done once it has finished or unwound"""
+    try:
+        return await coro
+    finally:
+        done.set()
+
+
+async def _open_http_session() -> aiohttp.ClientSession:
+    """Create an aiohttp session on the running loop"""
+    return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10, sock_connect=5))
+
+
+async def _info_bundle(wallet_manager: WalletManager):
+    """Fetch USDC balance and wallet info in parallel"""
+    return await asyncio.gather(
+        wallet_manager.get_usdc_balance(),
+        wallet_manager.get_wallet_info()
+    )
+
 class X402CLI(cmd.Cmd):
     """Interactive CLI for X402 CDP Integration"""
     
@@ -49,6 +148,15 @@ Type "help" for more details
         self.command_registry = CommandRegistry(wallet_manager)
         self.server_url = get_server_url()
         self.cdp_signer = None
+        self._account_name: Optional[str] = None
+        
+        # One event loop for the whole session, driven from a background thread
+        self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        
+        # Long-lived keep-alive HTTP session shared by free and X402 tier commands
+        self.http = self.run_sync(_open_http_session())
         
         # Set up command aliases
         self.command_aliases = {
@@ -63,24 +171,50 @@ Type "help" for more details
             'premium': 'tier2',
             'enterprise': 'tier3'
         }
+        
+        # Parse the static intro and help markup once instead of on every print
+        self._intro_renderable = Text.from_markup(self.intro, style="cyan")
+        self._help_renderable = Text.from_markup(HELP_TEXT, style="cyan")
+        
+        # Bind aliases as do_* attributes so cmd.Cmd dispatches them directly
+        for alias, canonical in self.command_aliases.items():
+            setattr(self, 'do_' + alias, getattr(self, 'do_' + canonical))
+    
+    def run_sync(self, coro):
+        """
+        Run a coroutine on the session event loop and wait for its result
+        
+        If the wait is interrupted (e.g. Ctrl-C), the coroutine is cancelled
+        and given a moment to unwind before the exception propagates, so
+        callers never tear down resources it is still using.
+        """
+        done = threading.Event()
+        future = asyncio.run_coroutine_threadsafe(_signal_when_done(coro, done), self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            done.wait(_CANCEL_GRACE)
+            raise
     
     def _init_cdp_signer(self):
         """Initialize CDP signer for X402 integration"""
         try:
-            if self.cdp_signer is None:
-                # Get wallet info to create signer
-                wallet_info = asyncio.run(self.wallet_manager.get_wallet_info())
+            if self.cdp_signer is not None:
+                return True
+            
+            if self._account_name is None:
+                # Get wallet info to create signer (cached until refresh)
+                wallet_info = self.run_sync(self.wallet_manager.get_wallet_info())
                 if not wallet_info or not wallet_info.get('accounts'):
                     console.print("❌ No wallet account found", style="red")
                     return False
                 
-                account_info = wallet_info['accounts'][0]
-                account_name = account_info['name']
-                
-                # Use the official EvmLocalAccount wrapper
-                self.cdp_signer = get_cdp_local_account_sync(account_name)
-                console.print("✅ CDP signer initialized", style="green")
+                self._account_name = wallet_info['accounts'][0]['name']
             
+            # Use the official EvmLocalAccount wrapper, created on the session loop
+            self.cdp_signer = self.run_sync(get_cdp_local_account(self._account_name))
+            console.print("✅ CDP signer initialized", style="green")
             return True
         except Exception as e:
             logger.error("Failed to initialize CDP signer", e)
@@ -95,7 +229,7 @@ Type "help" for more details
         """Check USDC balance"""
         try:
             # Run async operation
-            balance = asyncio.run(self.wallet_manager.get_usdc_balance())
+            balance = self.run_sync(self.wallet_manager.get_usdc_balance())
             console.print(f"💰 Current USDC balance: {balance} USDC", style="green")
         except Exception as e:
             logger.error("Failed to get balance", e)
@@ -113,10 +247,10 @@ Type "help" for more details
             console.print(f"🔄 Funding wallet with {amount} USDC...", style="yellow")
             
             # Run async operation
-            success = asyncio.run(self.wallet_manager.fund_wallet(amount))
+            success = self.run_sync(self.wallet_manager.fund_wallet(amount))
             
             if success:
-                balance = asyncio.run(self.wallet_manager.get_usdc_balance())
+                balance = self.run_sync(self.wallet_manager.get_usdc_balance())
                 console.print(f"✅ Funding operation completed!", style="green")
                 console.print(f"💰 New balance: {balance} USDC", style="green")
             else:
@@ -128,11 +262,8 @@ Type "help" for more details
     def do_tier1(self, arg):
         """X402 Basic Premium (~0.01 USDC)"""
         try:
-            from src.client.commands.x402.tier1 import tier1_command
-            import asyncio
-            
             console.print("🎯 X402 Basic Premium", style="cyan")
-            asyncio.run(tier1_command(self.wallet_manager))
+            self.run_sync(_tier(1)(self.wallet_manager, self.http, background=True))
             
         except Exception as e:
             logger.error("Failed to execute tier1 command", e)
@@ -141,11 +272,8 @@ Type "help" for more details
     def do_tier2(self, arg):
         """X402 Premium Plus (~0.1 USDC)"""
         try:
-            from src.client.commands.x402.tier2 import tier2_command
-            import asyncio
-            
             console.print("🎯 X402 Premium Plus", style="cyan")
-            asyncio.run(tier2_command(self.wallet_manager))
+            self.run_sync(_tier(2)(self.wallet_manager, self.http, background=True))
             
         except Exception as e:
             logger.error("Failed to execute tier2 command", e)
@@ -154,11 +282,8 @@ Type "help" for more details
     def do_tier3(self, arg):
         """X402 Enterprise (~1.0 USDC)"""
         try:
-            from src.client.commands.x402.tier3 import tier3_command
-            import asyncio
-            
             console.print("🎯 X402 Enterprise", style="cyan")
-            asyncio.run(tier3_command(self.wallet_manager))
+            self.run_sync(_tier(3)(self.wallet_manager, self.http, background=True))
             
         except Exception as e:
             logger.error("Failed to execute tier3 command", e)
@@ -168,10 +293,9 @@ Type "help" for more details
         """Access free content"""
         try:
             from src.client.commands.free import free_command
-            import asyncio
             
             console.print("🎯 Accessing Free Content", style="cyan")
-            asyncio.run(free_command([]))
+            self.run_sync(free_command([], self.http))
             
         except Exception as e:
             logger.error("Failed to access free content", e)
@@ -182,9 +306,8 @@ Type "help" for more details
         try:
             address = self.wallet_manager.get_address()
             
-            # Run async operations
-            balance = asyncio.run(self.wallet_manager.get_usdc_balance())
-            wallet_info = asyncio.run(self.wallet_manager.get_wallet_info())
+            # Fetch balance and wallet info concurrently
+            balance, wallet_info = self.run_sync(_info_bundle(self.wallet_manager))
             
             table = Table(title="Wallet Information")
             table.add_column("Property", style="cyan")
@@ -192,9 +315,8 @@ Type "help" for more details
             
             table.add_row("Address", address)
             table.add_row("Balance", f"{balance} USDC")
-            table.add_row("Network", "Base Sepolia")
-            table.add_row("Status", "Active")
-            table.add_row("Type", "CDP Accounts V2")
+            for row in _STATIC_INFO_ROWS:
+                table.add_row(*row)
             
             if wallet_info and wallet_info.get('accounts'):
                 account_name = wallet_info['accounts'][0]['name']
@@ -210,16 +332,21 @@ Type "help" for more details
         try:
             console.print("🔄 Refreshing wallet data from blockchain...", style="yellow")
             
-            # Run async operations to refresh
-            balance = asyncio.run(self.wallet_manager.get_usdc_balance())
-            wallet_info = asyncio.run(self.wallet_manager.get_wallet_info())
+            # Fetch balance and wallet info concurrently
+            balance, wallet_info = self.run_sync(_info_bundle(self.wallet_manager))
             
             console.print(f"✅ Refresh completed!", style="green")
             console.print(f"💰 Current balance: {balance} USDC", style="green")
             
+            account_name = None
             if wallet_info and wallet_info.get('accounts'):
                 account_name = wallet_info['accounts'][0]['name']
                 console.print(f"📝 Account: {account_name}", style="green")
+            
+            # Keep the cached signer unless the wallet account changed
+            if account_name != self._account_name:
+                self.cdp_signer = None
+                self._account_name = account_name
                 
         except Exception as e:
             logger.error("Failed to refresh wallet", e)
@@ -227,51 +354,11 @@ Type "help" for more details
     def do_clear(self, arg):
         """Clear the screen"""
         console.clear()
-        console.print(self.intro, style="cyan")
+        console.print(self._intro_renderable)
     
     def do_help(self, arg):
         """Show detailed help"""
-        help_text = """
-📖 **Available Commands**
-
-**Wallet Management:**
-  balance, bal     - Check USDC balance
-  fund [amount]    - Fund wallet with USDC (default: 5.0)
-  info, status     - Show wallet information
-  refresh, reload  - Force refresh from blockchain
-
-**X402 Premium Content:**
-  tier1, basic     - X402 Basic Premium (~0.01 USDC)
-                    Basic premium features with AI analysis and market data
-  tier2, premium   - X402 Premium Plus (~0.1 USDC)
-                    Advanced AI models, predictive analytics, and exclusive reports
-  tier3, enterprise- X402 Enterprise (~1.0 USDC)
-                    Enterprise analytics, institutional data, and custom insights
-  free             - Access free content (no payment required)
-
-**Utility:**
-  clear, cls       - Clear the screen
-  help, h          - Show this help message
-  exit, quit, q    - Exit the CLI
-
-**Examples:**
-  balance          - Check current USDC balance
-  fund             - Fund with 5.0 USDC
-  fund 10          - Fund with 10.0 USDC
-  tier1            - Access Basic Premium content
-  tier2            - Access Premium Plus content
-  tier3            - Access Enterprise content
-  free             - Access free content
-  info             - Show wallet details
-  refresh          - Refresh data from blockchain
-
-**X402 Payment Flow:**
-  • Commands automatically check your balance
-  • Payments are processed via X402 protocol
-  • Dynamic pricing is discovered during requests
-  • Balance is refreshed after successful payments
-"""
-        console.print(help_text, style="cyan")
+        console.print(self._help_renderable)
     
     def do_exit(self, arg):
         """Exit the CLI"""
@@ -279,46 +366,90 @@ Type "help" for more details
         logger.info("Session saved. Goodbye!")
         return True
     
+    def cmdloop(self, intro=None):
+        """Run the command loop, using prompt_toolkit for line input when installed"""
+        if PromptSession is None:
+            return super().cmdloop(intro)
+        
+        # Completion words are built once from the handlers and aliases
+        words = [name[3:] for name in self.get_names() if name.startswith('do_')]
+        session = PromptSession(
+            history=FileHistory('.cdp_history'),
+            completer=WordCompleter(words + list(self.command_aliases))
+        )
+        
+        self.preloop()
+        if intro is not None:
+            self.intro = intro
+        if self.intro:
+            self.stdout.write(str(self.intro) + "\n")
+        
+        stop = None
+        while not stop:
+            try:
+                # sys.stdout/sys.stderr writes made while prompting (e.g. the
+                # background balance refresh) are printed above the prompt
+                with patch_stdout():
+                    line = session.prompt(self.prompt)
+            except EOFError:
+                line = 'exit'
+            line = self.precmd(line)
+            stop = self.onecmd(line)
+            stop = self.postcmd(stop, line)
+        self.postloop()
+    
     def emptyline(self):
         """Do nothing on empty line"""
         pass
     
     def preloop(self):
         """Called before the command loop starts"""
+        # Warm tier command imports so the first payment has no import stall
+        try:
+            for n in (1, 2, 3):
+                _tier(n)
+        except Exception as e:
+            logger.error("Failed to preload tier commands", e)
         logger.success("✅ Session initialized successfully!")
     
     def postloop(self):
         """Called after the command loop ends"""
+        self.close()
+    
+    def close(self):
+        """Close the HTTP session and stop the session event loop (idempotent)"""
+        if self._loop.is_closed():
+            return
+        try:
+            # Pending balance refreshes must unwind before the loop is closed
+            from src.client.commands.x402 import cancel_background_tasks
+            self.run_sync(cancel_background_tasks())
+            self.run_sync(self.http.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
         logger.info("Session cleanup completed")
 
-    def onecmd(self, line: str):
-        """Override to support command aliases"""
-        if not line.strip():
-            return self.emptyline()
-        cmd, *args = line.strip().split(maxsplit=1)
-        canonical = self.command_aliases.get(cmd, cmd)
-        new_line = canonical
-        if args:
-            new_line += ' ' + args[0]
-        return super().onecmd(new_line)
-
 def main():
     from src.shared.utils.wallet_manager import WalletManager
-    import asyncio
     
     # Initialize wallet manager and get/create wallet
     wallet_manager = WalletManager()
+    cli = X402CLI(wallet_manager)
     
-    # Initialize wallet account
     try:
-        asyncio.run(wallet_manager.get_or_create_wallet())
-        console.print("✅ Wallet initialized successfully!", style="green")
-    except Exception as e:
-        console.print(f"❌ Failed to initialize wallet: {e}", style="red")
-        return
-    
-    cli = X402CLI(wallet_manager)
-    cli.cmdloop()
+        # Initialize wallet account
+        try:
+            cli.run_sync(wallet_manager.get_or_create_wallet())
+            console.print("✅ Wallet initialized successfully!", style="green")
+        except Exception as e:
+            console.print(f"❌ Failed to initialize wallet: {e}", style="red")
+            return
+        
+        cli.cmdloop()
+    finally:
+        cli.close()
 
 if __name__ == "__main__" or __name__ == "src.client.core.cli":
     main() 
\ No newline at end of file
@@ -14,15 +14,137 @@ Features:
 - Professional logging and debugging support
 """
 
-import requests
-import json
-import base64
+import asyncio
+import aiohttp
+import orjson
+import binascii
+import functools
 import time
-import secrets
-from typing import Dict, Any, Optional, Union
+import os
+from typing import Dict, Any, List, Optional, Tuple, Union
 from ...shared.utils.logger import logger
-from eth_utils import to_hex
-from cdp.openapi_client.models.eip712_domain import EIP712Domain
+from ...shared.config import get_server_url
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+try:
+    from eth_account import Account
+except ImportError:
+    Account = None
+
+# X402 protocol version this client speaks
+_X402_VERSION = 1
+
+# How long discovered payment requirements are reused before re-probing
+_REQUIREMENTS_TTL = 300  # seconds
+
+# Payment requirements per URL as (expiry, requirements). Requirements belong
+# to the endpoint, not the signer, so they are shared by all client instances.
+_requirements_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+# EIP-712 types for USDC TransferWithAuthorization; fixed, so built once.
+# Shared across payments - treat as read-only.
+_AUTHORIZATION_TYPES: Dict[str, Any] = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"}
+    ],
+    "TransferWithAuthorization": [
+        {"name": "from", "type": "address"},
+        {"name": "to", "type": "address"},
+        {"name": "value", "type": "uint256"},
+        {"name": "validAfter", "type": "uint256"},
+        {"name": "validBefore", "type": "uint256"},
+        {"name": "nonce", "type": "bytes32"}
+    ]
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _eip712_domain(asset: str) -> Dict[str, Any]:
+    """
+    Create EIP-712 domain object (cached per asset, treat as read-only)
+    
+    Args:
+        asset: USDC contract address
+        
+    Returns:
+        EIP-712 domain object
+    """
+    return {
+        "name": "USDC",
+        "version": "2",
+        "chainId": 84532,  # Base Sepolia
+        "verifyingContract": asset
+    }
+
+
+# Network the EIP-712 domain above is pinned to (chainId 84532)
+_NETWORK = "base-sepolia"
+
+# USDC on Base Sepolia, used when the server does not name an asset
+_DEFAULT_USDC_ASSET = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+_DEFAULT_DOMAIN = _eip712_domain(_DEFAULT_USDC_ASSET)
+
+# Bytes of randomness drawn per nonce pool refill (32 nonces)
+_NONCE_POOL_SIZE = 1024
+
+# Timeout for the paying X-PAYMENT request. Settlement happens on-chain before
+# the server responds, so only the connect is bounded tightly; the session's
+# 10s total still applies to discovery probes.
+_PAYMENT_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=60)
+
+# Payment requirement fields and the response keys they may arrive under
+_FIELD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "scheme": ("scheme",),
+    "network": ("network",),
+    "amount": ("maxAmountRequired",),
+    "recipient": ("payTo", "pay_to"),
+    "resource": ("resource",),
+    "asset": ("asset",),
+    "extra": ("extra",)
+}
+
+
+def _wei_to_usdc(wei_amount: str) -> str:
+    """
+    Format a USDC base-unit amount (6 decimals) as a decimal string
+    
+    Args:
+        wei_amount: Amount in USDC base units
+        
+    Returns:
+        Exact decimal USDC amount, e.g. "0.010000"
+    """
+    try:
+        value = int(wei_amount)
+    except (TypeError, ValueError):
+        return "0.000000"
+    whole, fraction = divmod(abs(value), 1_000_000)
+    return f"{'-' if value < 0 else ''}{whole}.{fraction:06d}"
+
+
+def _decode_body(body: bytes) -> Any:
+    """
+    Decode a response body as JSON, falling back to text
+    
+    Args:
+        body: Raw response body
+        
+    Returns:
+        Parsed JSON value, or the body as text if it is not JSON
+    """
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return body.decode(errors='replace')
+
 
 class PaymentPayloadError(Exception):
     """Custom exception for payment payload creation errors"""
@@ -39,7 +161,50 @@ class SignatureError(Exception):
     pass
 
 
-class CDPSigner:
+class PaymentSigner:
+    """
+    Base class for the EIP-712 signers a CustomX402Client accepts
+    
+    Subclasses set account, address and _sign, an async callable taking the
+    domain, types, primary_type and message keyword arguments.
+    """
+    
+    __slots__ = ('account', 'address', '_sign')
+    
+    async def sign_typed_data(
+        self, 
+        domain: Dict[str, Any], 
+        types: Dict[str, Any], 
+        primary_type: str, 
+        message: Dict[str, Any]
+    ) -> str:
+        """
+        Sign typed data
+        
+        Args:
+            domain: EIP-712 domain object
+            types: EIP-712 types definition
+            primary_type: Primary type for signing
+            message: Message data to sign
+            
+        Returns:
+            Signature as hex string
+            
+        Raises:
+            SignatureError: If signing fails
+        """
+        try:
+            return await self._sign(
+                domain=domain,
+                types=types,
+                primary_type=primary_type,
+                message=message
+            )
+        except Exception as e:
+            raise SignatureError(f"Failed to sign typed data: {e}")
+
+
+class CDPSigner(PaymentSigner):
     """
     Wrapper for CDP account to provide consistent interface
     
@@ -47,28 +212,64 @@ class CDPSigner:
     and type safety for EIP-712 signature generation.
     """
     
+    __slots__ = ()
+    
     def __init__(self, account: Any):
         """
         Initialize CDP signer wrapper
         
         Args:
             account: CDP account instance with sign_typed_data method
+            
+        Raises:
+            ValueError: If account lacks an address or sign_typed_data
         """
         self.account = account
         self.address = getattr(account, "address", None)
+        self._sign = getattr(account, "sign_typed_data", None)
         
         if not self.address:
             raise ValueError("CDP account must have an address attribute")
+        if self._sign is None:
+            raise ValueError("CDP account must support sign_typed_data")
+
+
+class LocalSigner(PaymentSigner):
+    """
+    Signer that produces EIP-712 signatures in-process from a local key
     
-    async def sign_typed_data(
-        self, 
-        domain: Dict[str, Any], 
-        types: Dict[str, Any], 
-        primary_type: str, 
+    Avoids the CDP signing round trip on every payment. The key must belong
+    to the wallet that pays (e.g. exported from the CDP account).
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, private_key: str):
+        """
+        Initialize local signer
+        
+        Args:
+            private_key: Hex private key of the paying wallet
+            
+        Raises:
+            ValueError: If eth-account is missing or the key is invalid
+        """
+        if Account is None:
+            raise ValueError("Local signing requires eth-account to be installed")
+        
+        self.account = Account.from_key(private_key)
+        self.address = self.account.address
+        self._sign = self._sign_local
+    
+    async def _sign_local(
+        self,
+        domain: Dict[str, Any],
+        types: Dict[str, Any],
+        primary_type: str,
         message: Dict[str, Any]
     ) -> str:
         """
-        Sign typed data using CDP account
+        Sign typed data with the local key
         
         Args:
             domain: EIP-712 domain object
@@ -77,23 +278,22 @@ class CDPSigner:
             message: Message data to sign
             
         Returns:
-            Signature as hex string
-            
-        Raises:
-            SignatureError: If signing fails
+            Signature as 0x-prefixed hex string
         """
-        try:
-            if hasattr(self.account, 'sign_typed_data'):
-                return await self.account.sign_typed_data(
-                    domain=domain,
-                    types=types,
-                    primary_type=primary_type,
-                    message=message
-                )
-            else:
-                raise SignatureError("CDP account does not support sign_typed_data")
-        except Exception as e:
-            raise SignatureError(f"Failed to sign typed data: {e}")
+        # X402 carries integers as decimal strings; EIP-712 encoding needs ints
+        field_types = {field["name"]: field["type"] for field in types[primary_type]}
+        message = {
+            key: int(value) if isinstance(value, str) and field_types.get(key, "").startswith(("uint", "int")) else value
+            for key, value in message.items()
+        }
+        
+        signed = self.account.sign_typed_data(full_message={
+            "types": types,
+            "primaryType": primary_type,
+            "domain": domain,
+            "message": message
+        })
+        return f"0x{bytes(signed.signature).hex()}"
 
 
 class CustomX402Client:
@@ -104,73 +304,93 @@ class CustomX402Client:
     integration, comprehensive error handling, and professional logging.
     """
     
-    def __init__(self, signer: CDPSigner):
+    __slots__ = (
+        'signer', 'session', '_owns_session', '_address', '_sign',
+        '_nonce_buf', '_nonce_off'
+    )
+    
+    def __init__(
+        self,
+        signer: PaymentSigner,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         """
         Initialize custom X402 client
         
         Args:
-            signer: CDP signer wrapper for EIP-712 signing
+            signer: Signer for EIP-712 signing (CDPSigner or LocalSigner)
+            session: Optional shared HTTP session to reuse pooled connections.
+                If omitted, the client opens its own on first use; release it
+                with aclose().
             
         Raises:
             ValueError: If signer is invalid
         """
-        if not isinstance(signer, CDPSigner):
-            raise ValueError("Signer must be a CDPSigner instance")
+        if not isinstance(signer, PaymentSigner):
+            raise ValueError("Signer must be a PaymentSigner instance")
         
         self.signer = signer
-        self.session = requests.Session()
+        # Bound once; both are used on every payment
+        self._address = signer.address
+        self._sign = signer.sign_typed_data
+        self.session = session
+        self._owns_session = session is None
+        self._nonce_buf = bytearray()
+        self._nonce_off = 0
         
-        logger.info(f"✅ Custom X402 client initialized with signer: {self.signer.address}")
+        logger.info(f"✅ Custom X402 client initialized with signer: {self._address}")
     
-    def _create_authorization_types(self) -> Dict[str, Any]:
+    async def _get_session(self) -> aiohttp.ClientSession:
         """
-        Create EIP-712 authorization types definition
+        Get the HTTP session, creating an owned one on first use
         
         Returns:
-            EIP-712 types definition for TransferWithAuthorization
+            Open aiohttp client session
         """
-        return {
-            "EIP712Domain": [
-                {"name": "name", "type": "string"},
-                {"name": "version", "type": "string"},
-                {"name": "chainId", "type": "uint256"},
-                {"name": "verifyingContract", "type": "address"}
-            ],
-            "TransferWithAuthorization": [
-                {"name": "from", "type": "address"},
-                {"name": "to", "type": "address"},
-                {"name": "value", "type": "uint256"},
-                {"name": "validAfter", "type": "uint256"},
-                {"name": "validBefore", "type": "uint256"},
-                {"name": "nonce", "type": "bytes32"}
-            ]
-        }
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                ),
+                timeout=aiohttp.ClientTimeout(total=10, sock_connect=5)
+            )
+            self._owns_session = True
+        return self.session
     
-    def _create_eip712_domain(self, asset: str) -> Dict[str, Any]:
-        """
-        Create EIP-712 domain object
-        
-        Args:
-            asset: USDC contract address
-            
-        Returns:
-            EIP-712 domain object
-        """
-        return {
-            "name": "USDC",
-            "version": "2",
-            "chainId": 84532,  # Base Sepolia
-            "verifyingContract": asset
-        }
+    async def aclose(self) -> None:
+        """Close the HTTP session if this client created it and wipe unused nonces"""
+        self._nonce_buf[:] = bytes(len(self._nonce_buf))
+        self._nonce_off = len(self._nonce_buf)
+        if self._owns_session and self.session is not None and not self.session.closed:
+            await self.session.close()
+    
+    async def __aenter__(self) -> "CustomX402Client":
+        await self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
     
     def _generate_nonce(self) -> str:
         """
         Generate a cryptographically secure nonce
         
+        Nonces are sliced from a pool drawn from os.urandom, refilled when
+        exhausted, so a burst of payments costs one RNG call per pool.
+        
         Returns:
             Hex nonce string with 0x prefix
         """
-        return "0x" + secrets.token_hex(32)
+        start = self._nonce_off
+        if start >= len(self._nonce_buf):
+            self._nonce_buf = bytearray(os.urandom(_NONCE_POOL_SIZE))
+            start = 0
+        end = start + 32
+        self._nonce_off = end
+        return f"0x{self._nonce_buf[start:end].hex()}"
     
     def _create_authorization_object(
         self, 
@@ -192,7 +412,7 @@ class CustomX402Client:
         nonce = self._generate_nonce()
         
         return {
-            "from": self.signer.address,
+            "from": self._address,
             "to": recipient,
             "value": amount,
             "validAfter": "0",  # Set to 0 to eliminate race conditions entirely
@@ -221,16 +441,17 @@ class CustomX402Client:
             SignatureError: If signing fails
         """
         try:
-            logger.debug(f"Signing data: {json.dumps({'domain': domain, 'message': authorization}, indent=2)}")
+            if logger.is_verbose:
+                logger.debug(f"Signing data: {orjson.dumps({'domain': domain, 'message': authorization}, option=orjson.OPT_INDENT_2).decode()}")
             
-            signature = await self.signer.sign_typed_data(
+            signature = await self._sign(
                 domain=domain,
                 types=types,
                 primary_type="TransferWithAuthorization",
                 message=authorization
             )
             
-            logger.debug(f"Signature generated successfully")
+            logger.debug("Signature generated successfully")
             return signature
             
         except Exception as e:
@@ -258,7 +479,7 @@ class CustomX402Client:
             Complete payment payload structure
         """
         payload = {
-            "x402Version": 1,
+            "x402Version": _X402_VERSION,
             "scheme": scheme,
             "network": network,
             "payload": {
@@ -272,7 +493,7 @@ class CustomX402Client:
         
         return payload
     
-    def _encode_payment_payload(self, payload: Dict[str, Any]) -> str:
+    def _encode_payment_payload(self, payload: Dict[str, Any]) -> bytes:
         """
         Encode payment payload as base64
         
@@ -280,16 +501,20 @@ class CustomX402Client:
             payload: Payment payload dictionary
             
         Returns:
-            Base64-encoded payment payload
+            Base64-encoded payment payload (ASCII bytes)
             
         Raises:
             PaymentPayloadError: If encoding fails
         """
         try:
-            payload_json = json.dumps(payload, separators=(',', ':'))
-            payload_base64 = base64.b64encode(payload_json.encode()).decode()
+            encoded = orjson.dumps(payload)
+            if pybase64 is not None:
+                payload_base64 = pybase64.b64encode(encoded)
+            else:
+                payload_base64 = binascii.b2a_base64(encoded, newline=False)
             
-            logger.debug(f"✅ Payment payload created: {payload_base64[:50]}...")
+            if logger.is_verbose:
+                logger.debug(f"✅ Payment payload created: {payload_base64[:50].decode()}...")
             return payload_base64
             
         except Exception as e:
@@ -304,7 +529,7 @@ class CustomX402Client:
         resource: Optional[str] = None,
         asset: Optional[str] = None,
         extra: Optional[Dict[str, Any]] = None
-    ) -> Optional[str]:
+    ) -> Optional[bytes]:
         """
         Create complete X402 payment payload
         
@@ -321,48 +546,50 @@ class CustomX402Client:
             Base64-encoded payment payload or None if creation fails
             
         Raises:
-            PaymentPayloadError: If payload creation fails
+            PaymentPayloadError: If parameters are missing or encoding fails
+            SignatureError: If signing fails
         """
-        try:
-            # Validate required parameters
-            if not all([scheme, network, amount, recipient]):
-                raise PaymentPayloadError("Missing required parameters for payment payload")
-            
-            # Set defaults
-            asset = asset or "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
-            
-            # Create timestamp and deadline
-            current_time = int(time.time())
-            deadline = current_time + 60  # 60 seconds from now
-            
-            # Create authorization object
-            authorization = self._create_authorization_object(recipient, amount, deadline)
-            
-            # Create EIP-712 types and domain
-            types = self._create_authorization_types()
-            domain = self._create_eip712_domain(asset)
-            
-            # Sign the payment data
-            signature = await self._sign_payment_data(domain, authorization, types)
-            
-            # Create payment payload structure
-            payload = self._create_payment_payload_structure(
-                scheme, network, signature, authorization, resource
-            )
-            
-            # Encode and return
-            return self._encode_payment_payload(payload)
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to create payment payload: {e}")
-            raise PaymentPayloadError(f"Payment payload creation failed: {e}")
+        # Validate required parameters
+        if not (scheme and network and amount and recipient):
+            missing = [
+                name for name, value in (
+                    ("scheme", scheme), ("network", network),
+                    ("amount", amount), ("recipient", recipient)
+                ) if not value
+            ]
+            raise PaymentPayloadError(f"Missing required parameters for payment payload: {', '.join(missing)}")
+        
+        # Set defaults
+        asset = asset or _DEFAULT_USDC_ASSET
+        
+        # Create deadline
+        deadline = time.time_ns() // 1_000_000_000 + 60  # 60 seconds from now
+        
+        # Create authorization object
+        authorization = self._create_authorization_object(recipient, amount, deadline)
+        
+        # Create EIP-712 types and domain
+        types = _AUTHORIZATION_TYPES
+        domain = _DEFAULT_DOMAIN if asset == _DEFAULT_USDC_ASSET else _eip712_domain(asset)
+        
+        # Sign the payment data
+        signature = await self._sign_payment_data(domain, authorization, types)
+        
+        # Create payment payload structure
+        payload = self._create_payment_payload_structure(
+            scheme, network, signature, authorization, resource
+        )
+        
+        # Encode and return
+        return self._encode_payment_payload(payload)
     
-    def _parse_x402_response(self, response: requests.Response) -> Dict[str, Any]:
+    def _parse_x402_response(self, response: aiohttp.ClientResponse, body: bytes) -> Dict[str, Any]:
         """
         Parse X402 response and extract payment requirements
         
         Args:
             response: HTTP response from server
+            body: Response body, already read by the caller
             
         Returns:
             Parsed X402 response data
@@ -371,30 +598,31 @@ class CustomX402Client:
             PaymentRequestError: If response parsing fails
         """
         try:
-            x402_data = response.json()
-            
-            # Extract X402 headers if present
-            x402_headers = {}
-            for key, value in response.headers.items():
-                if key.lower().startswith('x-x402'):
-                    x402_headers[key] = value
+            x402_data = orjson.loads(body)
             
-            logger.debug(f"X402 headers found: {x402_headers}")
+            # Extract X402 headers if present (only reported in verbose mode)
+            if logger.is_verbose:
+                x402_headers = {
+                    key: value for key, value in response.headers.items()
+                    if key[:6].lower() == 'x-x402'
+                }
+                
+                logger.debug(f"X402 headers found: {x402_headers}")
             
             # Check X402 version
             x402_version = x402_data.get('x402Version') or x402_data.get('x402_version')
-            if x402_version != 1:
+            if x402_version != _X402_VERSION:
                 raise PaymentRequestError(f"Unsupported X402 version: {x402_version}")
             
             logger.debug("Found X402 v1 format in response body")
             return x402_data
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise PaymentRequestError(f"Invalid JSON response: {e}")
         except Exception as e:
             raise PaymentRequestError(f"Failed to parse X402 response: {e}")
     
-    def _extract_payment_requirements(self, x402_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_payment_requirements(self, x402_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Extract payment requirements from X402 response
         
@@ -402,36 +630,25 @@ class CustomX402Client:
             x402_data: Parsed X402 response data
             
         Returns:
-            Payment requirements object
+            Payment requirements objects, one per accepted scheme, in the
+            server's order of preference
             
         Raises:
             PaymentRequestError: If payment requirements are invalid
         """
-        accepts = x402_data.get('accepts') or x402_data.get('accepts', [])
+        accepts = x402_data.get('accepts') or []
         if not accepts:
             raise PaymentRequestError("No payment schemes accepted")
         
-        # Use the first accepted payment scheme
-        payment_requirements = accepts[0]
-        
-        def get_key(d: Dict[str, Any], *keys: str) -> Optional[str]:
-            """Helper to get value from dict with multiple possible keys"""
-            for k in keys:
-                if k in d:
-                    return d[k]
-            return None
-        
-        return {
-            "scheme": get_key(payment_requirements, "scheme"),
-            "network": get_key(payment_requirements, "network"),
-            "amount": get_key(payment_requirements, "maxAmountRequired"),
-            "recipient": get_key(payment_requirements, "payTo", "pay_to"),
-            "resource": get_key(payment_requirements, "resource"),
-            "asset": get_key(payment_requirements, "asset"),
-            "extra": get_key(payment_requirements, "extra")
-        }
+        return [
+            {
+                field: next((payment_requirements[k] for k in keys if k in payment_requirements), None)
+                for field, keys in _FIELD_ALIASES.items()
+            }
+            for payment_requirements in accepts
+        ]
     
-    def _send_payment_request(self, url: str, payment_payload: str) -> Dict[str, Any]:
+    async def _send_payment_request(self, url: str, payment_payload: bytes) -> Dict[str, Any]:
         """
         Send payment request with X-PAYMENT header
         
@@ -446,113 +663,269 @@ class CustomX402Client:
             PaymentRequestError: If request fails
         """
         try:
+            # aiohttp only takes str header values; decode once here
             headers = {
-                'X-PAYMENT': payment_payload,
+                'X-PAYMENT': payment_payload.decode('ascii'),
                 'Content-Type': 'application/json'
             }
             
-            response = self.session.get(url, headers=headers)
-            
-            logger.debug(f"Payment response status: {response.status_code}")
-            logger.debug(f"Payment response headers: {dict(response.headers)}")
-            logger.debug(f"Payment response body: {response.text}")
-            
-            if response.status_code == 200:
-                logger.info("✅ Payment successful!")
-                return {
-                    "success": True,
-                    "status_code": 200,
-                    "data": response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text
-                }
-            else:
-                logger.error(f"❌ Payment failed: {response.status_code}")
-                try:
-                    error_data = response.json()
+            session = await self._get_session()
+            async with session.get(url, headers=headers, timeout=_PAYMENT_TIMEOUT) as response:
+                body = await response.read()
+                if logger.is_verbose:
+                    logger.debug(f"Payment response status: {response.status}")
+                    logger.debug(f"Payment response headers: {dict(response.headers)}")
+                    logger.debug(f"Payment response body: {body.decode(errors='replace')}")
+                
+                if response.status == 200:
+                    logger.info("✅ Payment successful!")
                     return {
-                        "success": False,
-                        "status_code": response.status_code,
-                        "error": error_data.get('error', f'Payment failed with status {response.status_code}'),
-                        "details": error_data
+                        "success": True,
+                        "status_code": 200,
+                        "data": _decode_body(body)
                     }
-                except:
+                
+                logger.error(f"❌ Payment failed: {response.status}")
+                error_data = _decode_body(body)
+                if isinstance(error_data, dict):
                     return {
                         "success": False,
-                        "status_code": response.status_code,
-                        "error": f"Payment failed with status {response.status_code}",
-                        "details": response.text
+                        "status_code": response.status,
+                        "error": error_data.get('error', f'Payment failed with status {response.status}'),
+                        "details": error_data
                     }
+                return {
+                    "success": False,
+                    "status_code": response.status,
+                    "error": f"Payment failed with status {response.status}",
+                    "details": error_data if isinstance(error_data, str) else body.decode(errors='replace')
+                }
                     
-        except Exception as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"❌ Failed to send payment request: {e}")
             raise PaymentRequestError(f"Payment request failed: {e}")
     
-    async def make_payment_request(self, url: str, amount: str = "10000") -> Dict[str, Any]:
+    async def _sign_requirements(self, amount: str, payment_requirements: Dict[str, Any]) -> bytes:
         """
-        Make a payment request to a protected endpoint
+        Create a signed payment payload for one set of payment requirements
         
-        This method orchestrates the complete X402 payment flow:
-        1. Initial request to get payment requirements
-        2. Parse X402 response and extract requirements
-        3. Create payment payload with EIP-712 signature
-        4. Send payment request with X-PAYMENT header
-        5. Handle response and return result
+        Args:
+            amount: Payment amount in wei
+            payment_requirements: One entry from _extract_payment_requirements
+            
+        Returns:
+            Base64-encoded payment payload
+            
+        Raises:
+            PaymentPayloadError: If payload creation fails
+            SignatureError: If signing fails
+        """
+        payment_payload = await self._create_payment_payload(
+            scheme=payment_requirements["scheme"],
+            network=payment_requirements["network"],
+            amount=amount,
+            recipient=payment_requirements["recipient"],
+            resource=payment_requirements["resource"],
+            asset=payment_requirements["asset"],
+            extra=payment_requirements["extra"]
+        )
+        
+        if not payment_payload:
+            raise PaymentPayloadError("Failed to create payment payload")
+        return payment_payload
+    
+    async def _pay(
+        self,
+        url: str,
+        amount: str,
+        payment_requirements: Dict[str, Any],
+        payment_payload: Optional[bytes] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a signed payment payload and send it with the X-PAYMENT header
         
         Args:
             url: The URL to request
-            amount: Payment amount in wei (default: 10000 = 0.01 USDC)
+            amount: Payment amount in wei
+            payment_requirements: One entry from _extract_payment_requirements
+            payment_payload: Payload already signed for these requirements
             
         Returns:
-            Dict containing the response data with success/error information
+            Response data dictionary
             
         Raises:
-            PaymentRequestError: If payment flow fails
+            PaymentRequestError: If request fails
             PaymentPayloadError: If payload creation fails
         """
-        logger.info(f"💸 Making payment request to: {url}")
-        logger.info(f"💰 Amount: {amount} wei (0.01 USDC)")
+        # Step 3: Create payment payload
+        if payment_payload is None:
+            payment_payload = await self._sign_requirements(amount, payment_requirements)
+        
+        # Step 4: Send payment with X-PAYMENT header
+        logger.info("Sending X402 payment with X-PAYMENT header")
+        return await self._send_payment_request(url, payment_payload)
+    
+    async def _pay_accepted(
+        self,
+        url: str,
+        amount: str,
+        accepted: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Pay using the first accepted scheme the server takes
+        
+        Only requirements on Base Sepolia are considered, since the signing
+        domain is pinned to that chain. When several remain, all of them are
+        signed in the background and the first is sent as soon as its payload
+        is ready, so falling back to the next one costs only a request.
+        Payments are still sent one at a time: any authorization that reaches
+        the server can settle, so racing them could pay more than once. For
+        the same reason only a 402 (payment rejected) moves on to the next
+        scheme; any other failure is returned as is.
         
+        Args:
+            url: The URL to request
+            amount: Payment amount in wei
+            accepted: Requirements from _extract_payment_requirements
+            
+        Returns:
+            (response data, requirements used for the last attempt)
+            
+        Raises:
+            PaymentRequestError: If request fails
+            PaymentPayloadError: If no payload could be created
+            SignatureError: If no payload could be signed
+        """
+        accepted = [requirements for requirements in accepted if requirements["network"] == _NETWORK]
+        if not accepted:
+            raise PaymentRequestError(f"No accepted payment option on {_NETWORK}")
+        if len(accepted) == 1:
+            return await self._pay(url, amount, accepted[0]), accepted[0]
+        
+        sign_tasks = [
+            asyncio.create_task(self._sign_requirements(amount, requirements))
+            for requirements in accepted
+        ]
+        
+        result = None
+        first_error = None
         try:
-            # Step 1: Make initial request to get X402 payment requirements
-            logger.debug(f"Making initial request to: {url}")
-            response = self.session.get(url)
+            for requirements, sign_task in zip(accepted, sign_tasks):
+                try:
+                    payload = await sign_task
+                except Exception as e:
+                    logger.warning(f"Skipping {requirements['scheme']}/{requirements['network']}: {e}")
+                    first_error = first_error or e
+                    continue
+                
+                result = await self._pay(url, amount, requirements, payload)
+                if result["status_code"] != 402:
+                    return result, requirements
+        finally:
+            # Drop signings that are no longer needed and reap their results
+            for sign_task in sign_tasks:
+                sign_task.cancel()
+            await asyncio.gather(*sign_tasks, return_exceptions=True)
+        
+        if result is None:
+            raise first_error
+        return result, requirements
+    
+    async def _discover(self, url: str) -> Tuple[Optional[Dict[str, Any]], Optional[List[Dict[str, Any]]]]:
+        """
+        Request a URL without payment to discover its payment requirements
+        
+        Args:
+            url: The URL to request
+            
+        Returns:
+            (result, None) when the endpoint answered without requiring
+            payment, otherwise (None, requirements for each accepted scheme)
             
-            if response.status_code == 200:
+        Raises:
+            PaymentRequestError: If the response is neither 200 nor a valid 402
+        """
+        # Step 1: Make initial request to get X402 payment requirements
+        logger.debug(f"Making initial request to: {url}")
+        session = await self._get_session()
+        async with session.get(url) as response:
+            if response.status != 200 and response.status != 402:
+                raise PaymentRequestError(f"Unexpected status code: {response.status}")
+            
+            if response.status == 402 and response.content_type != 'application/json':
+                # Payment requirements are always JSON; don't download anything else
+                raise PaymentRequestError(f"Unexpected 402 content type: {response.content_type}")
+            
+            body = await response.read()
+            if response.status == 200:
                 logger.info("✅ Payment not required, request successful")
                 return {
                     "success": True,
                     "status_code": 200,
-                    "data": response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text
-                }
-            
-            if response.status_code != 402:
-                raise PaymentRequestError(f"Unexpected status code: {response.status_code}")
+                    "data": _decode_body(body)
+                }, None
             
             logger.info("X402 payment required, processing payment flow")
-            logger.debug(f"Response status: {response.status_code}")
-            logger.debug(f"Response headers: {dict(response.headers)}")
-            logger.debug(f"Response body: {response.text}")
+            if logger.is_verbose:
+                logger.debug(f"Response status: {response.status}")
+                logger.debug(f"Response headers: {dict(response.headers)}")
+                logger.debug(f"Response body: {body.decode(errors='replace')}")
             
             # Step 2: Parse X402 payment requirements
-            x402_data = self._parse_x402_response(response)
-            payment_requirements = self._extract_payment_requirements(x402_data)
-            
-            # Step 3: Create payment payload
-            payment_payload = await self._create_payment_payload(
-                scheme=payment_requirements["scheme"],
-                network=payment_requirements["network"],
-                amount=amount,
-                recipient=payment_requirements["recipient"],
-                resource=payment_requirements["resource"],
-                asset=payment_requirements["asset"],
-                extra=payment_requirements["extra"]
-            )
+            x402_data = self._parse_x402_response(response, body)
+        
+        return None, self._extract_payment_requirements(x402_data)
+    
+    async def make_payment_request(self, url: str, amount: str = "10000") -> Dict[str, Any]:
+        """
+        Make a payment request to a protected endpoint
+        
+        This method orchestrates the complete X402 payment flow. When the
+        requirements for the URL were seen recently, the payment is sent on
+        the first request and the discovery steps are skipped:
+        1. Initial request to get payment requirements
+        2. Parse X402 response and extract requirements
+        3. Create payment payload with EIP-712 signature
+        4. Send payment request with X-PAYMENT header
+        5. Handle response and return result
+        
+        Args:
+            url: The URL to request
+            amount: Payment amount in wei (default: 10000 = 0.01 USDC)
             
-            if not payment_payload:
-                raise PaymentPayloadError("Failed to create payment payload")
+        Returns:
+            Dict containing the response data with success/error information
             
-            # Step 4: Send payment with X-PAYMENT header
-            logger.info("Sending X402 payment with X-PAYMENT header")
-            return self._send_payment_request(url, payment_payload)
+        Raises:
+            PaymentRequestError: If payment flow fails
+            PaymentPayloadError: If payload creation fails
+        """
+        logger.info(f"💸 Making payment request to: {url}")
+        logger.info(f"💰 Amount: {amount} wei ({_wei_to_usdc(amount)} USDC)")
+        
+        try:
+            # Fast path: pay on the first request with recently seen requirements
+            cached = _requirements_cache.get(url)
+            if cached is not None and cached[0] > time.monotonic():
+                logger.debug(f"Using cached payment requirements for: {url}")
+                result = await self._pay(url, amount, cached[1])
+                if result["status_code"] != 402:
+                    return result
+                
+                # Requirements changed on the server; rediscover them
+                logger.debug("Cached payment requirements rejected, rediscovering")
+                _requirements_cache.pop(url, None)
+            
+            # Steps 1-2: Discover payment requirements
+            result, accepted = await self._discover(url)
+            if result is not None:
+                return result
+            
+            # Steps 3-4: Create payment payload and send it
+            result, payment_requirements = await self._pay_accepted(url, amount, accepted)
+            if result["success"]:
+                _requirements_cache[url] = (time.monotonic() + _REQUIREMENTS_TTL, payment_requirements)
+            return result
             
         except (PaymentRequestError, PaymentPayloadError, SignatureError) as e:
             # Re-raise our custom exceptions
@@ -560,11 +933,49 @@ class CustomX402Client:
         except Exception as e:
             # Wrap unexpected errors
             raise PaymentRequestError(f"Unexpected error in payment flow: {e}")
+    
+    async def make_payment_requests(
+        self,
+        urls: List[str],
+        amount: str = "10000",
+        concurrency: int = 16
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Make payment requests to several protected endpoints concurrently
+        
+        Each URL runs the full make_payment_request flow; at most
+        `concurrency` flows are in flight at once, sharing the client's
+        pooled connections. Probes, CDP signing calls and payment requests
+        of different URLs overlap, so a batch costs roughly one flow's
+        latency per `concurrency` URLs. Raising `concurrency` much past the
+        server's and CDP's parallelism only queues work remotely.
+        
+        Args:
+            urls: The URLs to request
+            amount: Payment amount in wei for each request
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            One entry per URL, in the same order as urls: the response data
+            dictionary, or the exception that URL's flow raised. A failure
+            never hides the others, some of which may already have paid.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def bounded(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.make_payment_request(url, amount)
+        
+        return await asyncio.gather(*(bounded(url) for url in urls), return_exceptions=True)
 
 def create_x402_client(cdp_account, base_url: str = None) -> CustomX402Client:
     """
     Factory function to create X402 client with CDP account
     
+    Each call returns a new client. Its HTTP session is bound to the event
+    loop it is first used on, so callers that want connection reuse should
+    keep the client (or pass a session) rather than call this again.
+    
     Args:
         cdp_account: CDP account instance
         base_url: Base URL for the server (defaults to config)
@@ -573,8 +984,7 @@ def create_x402_client(cdp_account, base_url: str = None) -> CustomX402Client:
         Configured CustomX402Client instance
     """
     if base_url is None:
-        from ...shared.config import get_server_url
         base_url = get_server_url()
     
     signer = CDPSigner(cdp_account)
-    return CustomX402Client(signer) 
\ No newline at end of file
+    return CustomX402Client(signer)
@@ -44,6 +44,7 @@ def setup_client_logging():
 
 def main():
     """Main entry point for the CLI"""
+    cli = None
     try:
         # Setup logging from config
         setup_client_logging()
@@ -54,12 +55,12 @@ def main():
         # Initialize wallet manager
         logger.info("🔄 Initializing wallet session...")
         wallet_manager = WalletManager()
-        account = asyncio.run(wallet_manager.get_or_create_wallet())
+        cli = X402CLI(wallet_manager)
+        account = cli.run_sync(wallet_manager.get_or_create_wallet())
         
         logger.success(f"✅ EVM account ready: {account['address']}")
         
         # Start CLI
-        cli = X402CLI(wallet_manager)
         cli.cmdloop()
         
     except KeyboardInterrupt:
@@ -67,7 +68,9 @@ def main():
     except Exception as e:
         logger.error("CLI failed", e)
         sys.exit(1)
+    finally:
+        if cli is not None:
+            cli.close()
 
 if __name__ == "__main__":
-    import asyncio
     main() 
\ No newline at end of file
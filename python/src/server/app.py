@@ -73,32 +73,40 @@ async def log_requests(request: Request, call_next):
     return response
 
 # Apply official X402 middleware to protected routes for all tiers
-from x402.types import EIP712Domain, TokenAmount, TokenAsset
-
 usdc_asset = TokenAsset(
     address="0x036CbD53842c5426634e7929541eC2318f3dCF7e",  # USDC on Base Sepolia
     decimals=6,
     eip712=EIP712Domain(name="USDC", version="2"),
 )
 
-app.middleware("http")(require_payment(
-    path="/protected",
-    price=TokenAmount(amount="10000", asset=usdc_asset),  # 0.01 USDC
-    pay_to_address=wallet_config.get_receiving_address(),
-    network_id="base-sepolia"
-))
-app.middleware("http")(require_payment(
-    path="/premium",
-    price=TokenAmount(amount="100000", asset=usdc_asset),  # 0.1 USDC
-    pay_to_address=wallet_config.get_receiving_address(),
-    network_id="base-sepolia"
-))
-app.middleware("http")(require_payment(
-    path="/enterprise",
-    price=TokenAmount(amount="1000000", asset=usdc_asset),  # 1.0 USDC
-    pay_to_address=wallet_config.get_receiving_address(),
-    network_id="base-sepolia"
-))
+PAY_TO = wallet_config.get_receiving_address()
+
+# Price per protected path in USDC base units
+_price_table = {
+    "/protected": TokenAmount(amount="10000", asset=usdc_asset),  # 0.01 USDC
+    "/premium": TokenAmount(amount="100000", asset=usdc_asset),  # 0.1 USDC
+    "/enterprise": TokenAmount(amount="1000000", asset=usdc_asset),  # 1.0 USDC
+}
+
+# One prebuilt X402 middleware per protected path
+_payment_middleware = {
+    path: require_payment(
+        path=path,
+        price=price,
+        pay_to_address=PAY_TO,
+        network_id="base-sepolia"
+    )
+    for path, price in _price_table.items()
+}
+
+
+@app.middleware("http")
+async def x402_dispatch(request: Request, call_next):
+    """Route protected paths to their X402 middleware; pass everything else through"""
+    middleware = _payment_middleware.get(request.url.path)
+    if middleware is None:
+        return await call_next(request)
+    return await middleware(request, call_next)
 
 # Include route modules
 app.include_router(content_router, tags=["content"])
@@ -4,7 +4,7 @@ Content Routes Module
 Handles different content tiers and their respective endpoints.
 """
 
-import json
+import orjson
 import time
 import random
 from datetime import datetime, timedelta
@@ -134,8 +134,7 @@ def get_client_from_payment(request: Request) -> str:
     
     try:
         import base64
-        decoded = base64.b64decode(x_payment).decode('utf-8')
-        payment_data = json.loads(decoded)
+        payment_data = orjson.loads(base64.b64decode(x_payment))
         
         if payment_data.get('payload', {}).get('authorization', {}).get('from'):
             client_address = payment_data['payload']['authorization']['from']
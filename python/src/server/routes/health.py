@@ -11,6 +11,9 @@ from ..config import wallet_config
 
 router = APIRouter()
 
+# Config is loaded once at import, so the facilitator URL cannot change per request
+_FACILITATOR_URL = config.get_x402_config().get("facilitator_url", "https://x402.org/facilitator")
+
 
 @router.get("/health")
 async def health_check():
@@ -26,9 +29,6 @@ async def health_check():
         # Get wallet info for health check
         receiving_address = wallet_config.get_receiving_address()
         
-        # Get facilitator URL from config
-        facilitator_url = config.get_x402_config().get("facilitator_url", "https://x402.org/facilitator")
-        
         return {
             "status": "healthy",
             "service": "x402-server",
@@ -39,7 +39,7 @@ async def health_check():
             },
             "x402": {
                 "enabled": True,
-                "facilitator": facilitator_url
+                "facilitator": _FACILITATOR_URL
             }
         }
     except Exception as e:
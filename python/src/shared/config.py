@@ -5,6 +5,7 @@ Handles loading and managing configuration from the root config.yaml file.
 """
 
 import os
+import functools
 import yaml
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -103,13 +104,19 @@ def get_cdp_config() -> CDPConfig:
     )
 
 
+def get_local_signer_key() -> Optional[str]:
+    """Get the optional private key for local (non-CDP) payment signing"""
+    return os.getenv("X402_LOCAL_PRIVATE_KEY") or None
+
+
 def get_wallet_config() -> WalletConfig:
     """Get wallet configuration"""
     return WalletConfig()
 
 
+@functools.lru_cache(maxsize=None)
 def get_server_url(server_type: str = "python") -> str:
-    """Get server URL from configuration"""
+    """Get server URL from configuration (resolved once per server type)"""
     server_config = config.get_server_config(server_type)
     host = server_config.get("host", "localhost")
     port = server_config.get("port", 5001)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+LocalSigner test: sign a known USDC authorization and recover the signer
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+import asyncio
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+from src.client.core.custom_x402_client import (
+    LocalSigner,
+    _AUTHORIZATION_TYPES,
+    _DEFAULT_DOMAIN,
+)
+
+# Throwaway key used only by this test
+TEST_PRIVATE_KEY = "0x" + "11" * 32
+
+
+def test_local_signer_recovers_address():
+    """A LocalSigner signature recovers to the signer's address"""
+    signer = LocalSigner(TEST_PRIVATE_KEY)
+    message = {
+        "from": signer.address,
+        "to": "0x000000000000000000000000000000000000dEaD",
+        "value": "010000",  # zero-padded decimal, as some servers send it
+        "validAfter": "0",
+        "validBefore": "1700000000",
+        "nonce": "0x" + "ab" * 32
+    }
+
+    signature = asyncio.run(signer.sign_typed_data(
+        domain=_DEFAULT_DOMAIN,
+        types=_AUTHORIZATION_TYPES,
+        primary_type="TransferWithAuthorization",
+        message=message
+    ))
+
+    signable = encode_typed_data(full_message={
+        "types": _AUTHORIZATION_TYPES,
+        "primaryType": "TransferWithAuthorization",
+        "domain": _DEFAULT_DOMAIN,
+        "message": {
+            **message,
+            "value": 10000,
+            "validAfter": 0,
+            "validBefore": 1700000000
+        }
+    })
+    assert Account.recover_message(signable, signature=signature) == signer.address
+
+
+if __name__ == "__main__":
+    test_local_signer_recovers_address()
+    print("✅ LocalSigner signature recovers the signer address")
@@ -56,10 +56,13 @@ async def test_payment():
             x402_client = CustomX402Client(signer)
             
             print("\n💸 Sending X402 payment with custom client...")
-            result = await x402_client.make_payment_request(
-                url=f"{server_url}/protected",
-                amount="10000"
-            )
+            try:
+                result = await x402_client.make_payment_request(
+                    url=f"{server_url}/protected",
+                    amount="10000"
+                )
+            finally:
+                await x402_client.aclose()
             
     except Exception as e:
         print(f"❌ Failed to initialize CDP signer or send payment: {e}")